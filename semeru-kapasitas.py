@@ -1,21 +1,70 @@
 # -*- coding: utf-8 -*-
 # Semeru/Bromo kapasitas poller
 # Dependencies:
-#   pip install requests beautifulsoup4 colorama
+#   pip install requests selectolax brotli colorama
+#   (fallback tanpa selectolax: pip install beautifulsoup4 lxml)
+#   (opsional, multi target async: pip install aiohttp)
+#   (opsional, HTTP/2: pip install "httpx[http2]")
 #
 # Contoh pakai:
 #   python semeru-kapasitas.py --site-id 8 --year-month 2025-10 --target 2025-10-18 --ipv4
 #   python semeru-kapasitas.py --site-id 8 --year-month 2025-10 --target 2025-10-18 --loop --stop-when-available --interval 1 --ipv4
 
+import asyncio
+import html as htmllib
 import os
+import re
 import socket
+import sys
 import time
-from typing import Optional, List, Dict, Any, Union
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Optional, List, Dict, Any, Union, Iterator, Iterable, Tuple, Callable, NamedTuple
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NameResolutionError
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+try:
+    # pip install aiohttp (opsional, untuk polling banyak target sekaligus)
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
+try:
+    # pip install "httpx[http2]" (opsional, untuk HTTP/2 lewat --http2)
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:
+    # pip install brotli (opsional, agar server boleh kirim HTML terkompresi Brotli)
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    # Tanpa dekoder Brotli jangan minta "br", cukup gzip/deflate
+    ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    # pip install selectolax (parser Lexbor berbasis C, jauh lebih ringan dari BS4)
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        # selectolax lama (< 0.3) belum punya Lexbor; backend Modest dihapus di 1.0
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        # Fallback ke BeautifulSoup jika selectolax tidak tersedia
+        HTMLParser = None  # type: ignore[assignment,misc]
+        from bs4 import BeautifulSoup
+
+try:
+    # pip install lxml (parser berbasis C untuk BS4, jauh lebih cepat dari html.parser)
+    import lxml  # noqa: F401
+    BS4_PARSER = "lxml"
+except ImportError:
+    # Fallback ke parser bawaan Python jika lxml tidak tersedia
+    BS4_PARSER = "html.parser"
 
 from datetime import datetime
 from zoneinfo import ZoneInfo  # Python 3.9+
@@ -24,15 +73,60 @@ from zoneinfo import ZoneInfo  # Python 3.9+
 BASE_URL = "https://bromotenggersemeru.id"
 GET_VIEW_URL = f"{BASE_URL}/website/home/get_view"
 
+# Header "browser" untuk session (sync & async)
+SESSION_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"),
+    "X-Requested-With": "XMLHttpRequest",
+    "Accept": "text/html, */*; q=0.01",
+    "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Origin": BASE_URL,
+    "Referer": BASE_URL + "/",
+}
+
+# Header khusus POST get_view
+GET_VIEW_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Accept": "text/html, */*; q=0.01",
+    "X-Requested-With": "XMLHttpRequest",
+    "Origin": BASE_URL,
+    "Referer": BASE_URL + "/"
+}
+
+# Cache respons get_view per (id_site, year_month): (ETag, Last-Modified, html).
+# Dipakai untuk request kondisional; respons 304/412 = pakai html terakhir tanpa unduh ulang.
+_GET_VIEW_CACHE: Dict[Tuple[int, str], Tuple[Optional[str], Optional[str], str]] = {}
+
+# Jawaban "tidak berubah" untuk request kondisional. get_view adalah POST, dan untuk POST
+# If-None-Match yang cocok dijawab 412 (RFC 9110 §13.1.2), bukan 304.
+NOT_MODIFIED_STATUS = (304, 412)
+
+# Status HTTP yang menandakan cookie ci_session sudah tidak berlaku
+STALE_SESSION_STATUS = (401, 403, 419)
+
 MONTHS_ID = {
     "januari": 1, "februari": 2, "maret": 3, "april": 4, "mei": 5, "juni": 6,
     "juli": 7, "agustus": 8, "september": 9, "oktober": 10, "november": 11, "desember": 12
 }
 
+# Regex dikompilasi sekali saat modul dimuat (dipakai per baris, per polling)
+_TGL_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})")
+_WS_RE = re.compile(r"\s+")
+_INT_RE = re.compile(r"-?\d+")
+# Kata kunci status dalam satu kali scan ("kuota penuh" didahulukan dari "penuh")
+_STATUS_RE = re.compile(r"kuota penuh|penuh|tersedia|available|tersisa")
+_STATUS_FULL = frozenset(("kuota penuh", "penuh"))
+_STATUS_AVAILABLE = frozenset(("tersedia", "available", "tersisa"))
+
 # ======================= UTIL WAKTU =======================
+_WIB = ZoneInfo("Asia/Jakarta")
+
 def now_wib() -> str:
     """Timestamp WIB presisi detik, mis: 2025-09-17 21:43:05 WIB"""
-    return datetime.now(ZoneInfo("Asia/Jakarta")).strftime("%Y-%m-%d %H:%M:%S WIB")
+    d = datetime.now(_WIB)
+    # f-string langsung, lebih murah dari strftime untuk format tetap ini
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}:{d.second:02d} WIB"
 
 
 # ======================= WARNA TERMINAL =======================
@@ -69,26 +163,119 @@ def C(txt: str, fg: str = "", bright: bool = False, dim: bool = False) -> str:
 
 ACCENT = (Fore.CYAN, True)  # (warna, bright?)
 
+# Prefix ANSI dihitung sekali untuk baris log yang dicetak tiap polling
+_RST = Style.RESET_ALL
+_PRE_TS = (Style.BRIGHT if ACCENT[1] else "") + ACCENT[0]
+_PRE_TAG = Style.DIM + Fore.WHITE
+_PRE_OK = Style.BRIGHT + Fore.GREEN
+_PRE_SIZE = Fore.YELLOW
+_PRE_TIME = Fore.CYAN
+_GET_VIEW_TAG = C("[get_view]", Fore.CYAN)
+
+# Log per-request get_view; dimatikan oleh --quiet
+LOG_GET_VIEW = True
+
 def ts(tag: str) -> str:
-    fg, bright = ACCENT
-    return f"[{C(now_wib(), fg, bright=bright)}] {C(tag, Fore.WHITE, dim=True)}"
+    return f"[{_PRE_TS}{now_wib()}{_RST}] {_PRE_TAG}{tag}{_RST}"
+
+
+def _sleep_until(deadline: float) -> None:
+    """Tidur sampai `deadline` (time.monotonic); jadwal tetap walau durasi request berubah-ubah."""
+    time.sleep(max(0.0, deadline - time.monotonic()))
 
 
 # ======================= SESSION TAHAN BANTING =======================
+def _fast_reconnect_socket_options() -> List[Tuple[int, int, int]]:
+    """
+    Opsi socket untuk reconnect lebih cepat: TCP Fast Open sisi klien (Linux).
+    Didukung tidaknya dicek sekali di sini, karena setsockopt yang gagal
+    saat connect akan menggagalkan koneksi urllib3.
+    """
+    opts: List[Tuple[int, int, int]] = []
+    if not sys.platform.startswith("linux"):
+        return opts  # di macOS/BSD/Windows angka 30 bukan TCP_FASTOPEN_CONNECT
+    # Python lama tidak mengekspor konstanta ini; 30 = TCP_FASTOPEN_CONNECT di linux/tcp.h
+    tfo_connect = getattr(socket, "TCP_FASTOPEN_CONNECT", 30)
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.setsockopt(socket.IPPROTO_TCP, tfo_connect, 1)
+        opts.append((socket.IPPROTO_TCP, tfo_connect, 1))
+    except OSError:
+        pass  # kernel tidak mendukung TFO sisi klien (Linux < 4.11)
+    return opts
+
+_FAST_RECONNECT_OPTS = _fast_reconnect_socket_options()
+
+# Cache DNS (host -> (IPv4, kedaluwarsa)) untuk seluruh proses: session baru tidak perlu getaddrinfo lagi.
+# Ada TTL karena IP basi tidak selalu gagal di TCP connect (bisa baru gagal di TLS, mis. sertifikat lain).
+_DNS_TTL_SEC = 300
+_DNS_CACHE: Dict[str, Tuple[str, float]] = {}
+
+def _resolve_ipv4_cached(host: str) -> str:
+    now = time.monotonic()
+    cached = _DNS_CACHE.get(host)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    ip = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    _DNS_CACHE[host] = (ip, now + _DNS_TTL_SEC)
+    return ip
+
+class _PinnedDNSMixin:
+    """
+    Koneksi urllib3 yang membuka TCP ke IPv4 hasil cache DNS.
+    Hanya alamat socket yang diganti; Host header, SNI & verifikasi sertifikat
+    tetap memakai hostname asli (TLS dibungkus setelah _new_conn, dengan host dipulihkan).
+    """
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            self._dns_host = _resolve_ipv4_cached(host)
+        except socket.gaierror as e:
+            # Sama seperti urllib3 sendiri: gagal DNS = NameResolutionError (retry connect, bukan read)
+            raise NameResolutionError(host, self, e) from e
+        try:
+            return super()._new_conn()
+        except Exception:
+            _DNS_CACHE.pop(host, None)  # IP mungkin sudah basi: resolve ulang di percobaan berikut
+            raise
+        finally:
+            self._dns_host = host
+
+class _PinnedHTTPConnection(_PinnedDNSMixin, HTTPConnection):
+    pass
+
+class _PinnedHTTPSConnection(_PinnedDNSMixin, HTTPSConnection):
+    pass
+
+class _PinnedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _PinnedHTTPConnection
+
+class _PinnedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _PinnedHTTPSConnection
+
 class IPv4HTTPAdapter(HTTPAdapter):
-    """Opsional: paksa IPv4 dan aktifkan TCP keepalive."""
+    """Opsional: paksa IPv4 (DNS A record di-cache) dan aktifkan TCP keepalive."""
     def init_poolmanager(self, *args, **kwargs):
         from urllib3.poolmanager import PoolManager
-        # Tambah opsi TCP keepalive agar koneksi idle tidak cepat 'basi'
-        kwargs["socket_options"] = kwargs.get("socket_options", []) + [
+        # Pertahankan opsi bawaan urllib3 (TCP_NODELAY) yang hilang bila socket_options diisi,
+        # tambah TCP keepalive agar koneksi idle tidak cepat 'basi' + opsi reconnect cepat
+        kwargs["socket_options"] = kwargs.get("socket_options", HTTPConnection.default_socket_options) + [
             (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
             (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
             (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
-        ]
+        ] + _FAST_RECONNECT_OPTS
         self.poolmanager = PoolManager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _PinnedHTTPConnectionPool,
+            "https": _PinnedHTTPSConnectionPool,
+        }
 
-def build_session(force_ipv4: bool = True) -> requests.Session:
-    """Session tanpa proxy env + retry/backoff + header mirip browser."""
+def build_session(force_ipv4: bool = True, prewarm: bool = False) -> requests.Session:
+    """
+    Session tanpa proxy env + retry/backoff + header mirip browser.
+    prewarm=True: kirim HEAD ke BASE_URL agar pool sudah punya koneksi (TCP+TLS) siap pakai.
+    Blocking (bisa belasan detik jika server lambat), jadi hanya untuk polling loop dari CLI.
+    """
     # Pastikan tidak pakai proxy env yang bisa bikin hang
     for k in ("HTTPS_PROXY", "HTTP_PROXY", "ALL_PROXY"):
         os.environ.pop(k, None)
@@ -110,19 +297,78 @@ def build_session(force_ipv4: bool = True) -> requests.Session:
     s.mount("https://", adapter)
     s.mount("http://", adapter)
 
-    s.headers.update({
-        "User-Agent": ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                       "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html, */*; q=0.01",
-        "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Origin": BASE_URL,
-        "Referer": BASE_URL + "/",
-    })
+    s.headers.update(SESSION_HEADERS)
+
+    if prewarm:
+        try:
+            s.head(BASE_URL, timeout=(5, 10))
+        except requests.RequestException:
+            pass  # gagal pre-warm tidak fatal; POST pertama akan membuka koneksi sendiri
     return s
 
+def build_http2_client(force_ipv4: bool = True, asynchronous: bool = False) -> Any:
+    """
+    Alternatif build_session: httpx.Client (atau AsyncClient) dengan HTTP/2,
+    sehingga banyak request berbagi satu koneksi TCP+TLS (stream multiplexing).
+    """
+    if httpx is None:
+        raise RuntimeError('Mode HTTP/2 butuh httpx: pip install "httpx[http2]"')
+    transport_cls = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+    client_cls = httpx.AsyncClient if asynchronous else httpx.Client
+    transport = transport_cls(
+        http2=True,
+        retries=3,  # retry koneksi gagal (connect error)
+        limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=30),
+        local_address="0.0.0.0" if force_ipv4 else None,  # bind IPv4 = paksa IPv4
+    )
+    return client_cls(transport=transport, headers=SESSION_HEADERS, trust_env=False)
+
+def _is_httpx_client(s: Any) -> bool:
+    return httpx is not None and isinstance(s, (httpx.Client, httpx.AsyncClient))
+
+def _build_like(s: Any) -> Any:
+    """Session baru sejenis `s` (requests.Session / httpx.Client), untuk refresh setelah error."""
+    _DNS_CACHE.clear()  # host mungkin pindah IP: resolve ulang di session baru
+    return build_http2_client(force_ipv4=True) if _is_httpx_client(s) else build_session(force_ipv4=True)
+
+def _timeout_for(s: Any, timeout_connect: int, timeout_read: int) -> Any:
+    """Bentuk timeout sesuai klien: tuple untuk requests, httpx.Timeout untuk httpx."""
+    if _is_httpx_client(s):
+        return httpx.Timeout(timeout_read, connect=timeout_connect)
+    return (timeout_connect, timeout_read)
+
+def build_async_session(force_ipv4: bool = True, http2: bool = False) -> Any:
+    """
+    ClientSession aiohttp dengan satu connection pool bersama untuk banyak target.
+    Jika http2=True, pakai httpx.AsyncClient HTTP/2 (semua target di satu koneksi).
+    Harus dibuat di dalam event loop yang sedang berjalan.
+    """
+    if http2:
+        return build_http2_client(force_ipv4=force_ipv4, asynchronous=True)
+    if aiohttp is None:
+        raise RuntimeError("Mode async butuh aiohttp: pip install aiohttp")
+    connector = aiohttp.TCPConnector(
+        limit=20,
+        family=socket.AF_INET if force_ipv4 else 0,
+        keepalive_timeout=30,
+        ttl_dns_cache=300,  # DNS di-cache 5 menit, tidak resolve ulang tiap koneksi
+    )
+    return aiohttp.ClientSession(connector=connector, headers=SESSION_HEADERS, trust_env=False)
+
 
 # ======================= PARSER & FORMATTER =======================
+class KapasitasRow(NamedTuple):
+    """Satu baris (satu tanggal) tabel kapasitas."""
+    tanggalText: str
+    tanggalISO: Optional[str]
+    statusText: str
+    sisa: Optional[int]
+    isFull: bool
+    available: bool
+
+# Pencocok tanggal target: (tanggalISO, tanggalText) -> cocok?
+RowMatcher = Callable[[Optional[str], str], bool]
+
 def to_iso_from_tanggal_id(text: str) -> Optional[str]:
     """
     "Rabu, 1 Oktober 2025" -> "2025-10-01"
@@ -130,9 +376,8 @@ def to_iso_from_tanggal_id(text: str) -> Optional[str]:
     """
     if not text:
         return None
-    t = " ".join(text.split()).strip()
-    import re
-    m = re.search(r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})", t)
+    t = _WS_RE.sub(" ", text).strip()
+    m = _TGL_RE.search(t)
     if not m:
         return None
     dd, mm_name, yy = m.group(1), m.group(2).lower(), m.group(3)
@@ -141,94 +386,216 @@ def to_iso_from_tanggal_id(text: str) -> Optional[str]:
         return None
     return f"{yy}-{mm:02d}-{int(dd):02d}"
 
-def parse_kapasitas_rows(html: str) -> List[Dict[str, Any]]:
-    """
-    Parse tabel kapasitas menjadi list dict:
-    {tanggalText, tanggalISO, statusText, sisa, isFull, available}
-    """
-    import re
+# Isi sel status: (status_text, ada_hide?, isi_hide)
+_StatusCell = Tuple[str, bool, Optional[str]]
 
-    def _is_int_str(v: Optional[str]) -> bool:
-        return bool(v) and bool(re.fullmatch(r"-?\d+", v.strip()))
+# Parser HTML5 (Lexbor) membuang <tbody>/<tr> yang tidak berada di dalam <table>
+_TABLE_OPEN_RE = re.compile(r"<table\b", re.I)
 
-    soup = BeautifulSoup(html, "html.parser")
-    rows = []
-    for tr in soup.select("tbody tr"):
-        tds = tr.find_all("td")
+def _iter_date_cells_selectolax(html: str) -> Iterator[Tuple[str, Any]]:
+    """Iterasi baris tabel memakai selectolax (cepat): (tanggal_text, node td status)."""
+    if not _TABLE_OPEN_RE.search(html):
+        html = f"<table>{html}</table>"  # get_view bisa saja hanya mengirim potongan <tbody>
+    tree = HTMLParser(html)
+    for tr in tree.css("tbody tr"):
+        tds = tr.css("td")
         if len(tds) < 2:
             continue
+        yield tds[0].text(separator=" ", strip=True), tds[1]
 
-        tanggal_text = tds[0].get_text(strip=True, separator=" ")
+def _read_status_cell_selectolax(td: Any) -> _StatusCell:
+    status_el = td.css_first(".text-red, .text-green, .text-blue")
+    status_text = (status_el.text(separator=" ", strip=True) if status_el
+                   else td.text(separator=" ", strip=True))
 
-        status_el = tds[1].select_one(".text-red, .text-green, .text-blue")
-        status_text = (status_el.get_text(" ", strip=True) if status_el
-                       else tds[1].get_text(" ", strip=True))
+    hide_el = td.css_first(".hide")
+    hide_val_raw = hide_el.text(strip=True) if hide_el else None
+    return status_text, hide_el is not None, hide_val_raw
 
-        hide_el = tds[1].select_one(".hide")
-        hide_val_raw = hide_el.get_text(strip=True) if hide_el else None
+def _iter_date_cells_bs4(html: str) -> Iterator[Tuple[str, Any]]:
+    """Iterasi baris tabel memakai BeautifulSoup (fallback): (tanggal_text, tag td status)."""
+    soup = BeautifulSoup(html, BS4_PARSER)
+    for tr in soup.select("tbody tr"):
+        tds = tr.find_all("td", limit=2)  # hanya td[0] & td[1] yang dipakai
+        if len(tds) < 2:
+            continue
+        yield tds[0].get_text(strip=True, separator=" "), tds[1]
+
+def _read_status_cell_bs4(td: Any) -> _StatusCell:
+    status_el = td.select_one(".text-red, .text-green, .text-blue")
+    status_text = (status_el.get_text(" ", strip=True) if status_el
+                   else td.get_text(" ", strip=True))
+
+    hide_el = td.select_one(".hide")
+    hide_val_raw = hide_el.get_text(strip=True) if hide_el else None
+    return status_text, hide_el is not None, hide_val_raw
+
+# Backend parser aktif: selectolax bila terpasang, selain itu BeautifulSoup
+if HTMLParser is not None:
+    _iter_date_cells, _read_status_cell = _iter_date_cells_selectolax, _read_status_cell_selectolax
+else:
+    _iter_date_cells, _read_status_cell = _iter_date_cells_bs4, _read_status_cell_bs4
+
+# ---- Jalur cepat: regex untuk skema tabel yang sudah dikenal ----
+# Skema: <tbody><tr><td>Tanggal</td><td><span class="text-..">Status</span><span class="hide">N</span></td></tr>
+# Komentar & blok script/style diabaikan parser HTML; buang dulu agar baris di dalamnya tidak ikut terbaca
+_NON_CONTENT_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)|<(script|style)\b[^>]*>.*?(?:</\1\s*>|\Z)",
+    re.S | re.I,
+)
+_TBODY_RE = re.compile(r"<tbody\b[^>]*>(.*?)</tbody>", re.S | re.I)
+_TR_OPEN_RE = re.compile(r"<tr\b", re.I)
+_ROW_RE = re.compile(
+    r"<tr\b[^>]*>\s*<td\b[^>]*>(?P<tgl>[^<]*)</td>\s*<td\b[^>]*>(?P<cell>.*?)</td>",
+    re.S | re.I,
+)
+_STATUS_EL_RE = re.compile(
+    r"""<(\w+)\b[^>]*\bclass=["'](?:[^"']*\s)?text-(?:red|green|blue)(?:\s[^"']*)?["'][^>]*>([^<]*)</\1>""",
+    re.I,
+)
+_HIDE_EL_RE = re.compile(
+    r"""<(\w+)\b[^>]*\bclass=["'](?:[^"']*\s)?hide(?:\s[^"']*)?["'][^>]*>([^<]*)</\1>""",
+    re.I,
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+class _SchemaDrift(Exception):
+    """HTML tidak cocok dengan skema yang dikenal regex; pakai parser HTML biasa."""
+
+def _scan_cells_regex(html: str) -> List[Tuple[str, str]]:
+    """(tanggal_text, html sel status) per baris tbody, atau _SchemaDrift jika ada baris yang tak terbaca."""
+    cells: List[Tuple[str, str]] = []
+    n_tr = 0
+    for body in _TBODY_RE.findall(_NON_CONTENT_RE.sub("", html)):
+        n_tr += len(_TR_OPEN_RE.findall(body))
+        for m in _ROW_RE.finditer(body):
+            cells.append((htmllib.unescape(m.group("tgl")).strip(), m.group("cell")))
+    if not cells or len(cells) != n_tr:
+        raise _SchemaDrift()
+    return cells
+
+def _read_status_cell_regex(cell: str) -> _StatusCell:
+    status_m = _STATUS_EL_RE.search(cell)
+    hide_m = _HIDE_EL_RE.search(cell)
+    # Kelas dikenal tapi elemennya tidak terbaca (mis. ada tag bersarang) -> skema berubah
+    if (status_m is None and "text-" in cell) or (hide_m is None and "hide" in cell):
+        raise _SchemaDrift()
+
+    if status_m:
+        status_text = htmllib.unescape(status_m.group(2)).strip()
+    else:
+        parts = (htmllib.unescape(p).strip() for p in _TAG_RE.split(cell))
+        status_text = " ".join(p for p in parts if p)
 
-        # ======= PERUBAHAN: dukung angka negatif =======
-        if _is_int_str(hide_val_raw):
-            sisa: Optional[int] = int(hide_val_raw)   # termasuk nilai minus
-        else:
-            sisa = None
+    hide_val_raw = htmllib.unescape(hide_m.group(2)).strip() if hide_m else None
+    return status_text, hide_m is not None, hide_val_raw
+
+def _is_int_str(v: Optional[str]) -> bool:
+    return bool(v) and bool(_INT_RE.fullmatch(v.strip()))
+
+def _build_row(tanggal_text: str,
+               status_text: str,
+               has_hide: bool,
+               hide_val_raw: Optional[str],
+               tanggal_iso: Optional[str] = None) -> KapasitasRow:
+    """
+    Susun KapasitasRow dari isi sel mentah.
+    `tanggal_iso` boleh diberikan jika sudah dihitung pemanggil.
+    """
+    # ======= PERUBAHAN: dukung angka negatif =======
+    if _is_int_str(hide_val_raw):
+        sisa: Optional[int] = int(hide_val_raw)   # termasuk nilai minus
+    else:
+        sisa = None
 
+    if tanggal_iso is None:
         tanggal_iso = to_iso_from_tanggal_id(tanggal_text)
-        st_low = status_text.lower()
+    keywords = set(_STATUS_RE.findall(status_text.lower()))
 
-        is_full_text = ("penuh" in st_low) or ("kuota penuh" in st_low)
+    is_full_text = not keywords.isdisjoint(_STATUS_FULL)
 
-        # ======= PERUBAHAN: pakai _is_int_str untuk deteksi "disembunyikan" =======
-        hide_is_hidden = hide_el is not None and not _is_int_str(hide_val_raw)
+    # ======= PERUBAHAN: pakai _is_int_str untuk deteksi "disembunyikan" =======
+    hide_is_hidden = has_hide and not _is_int_str(hide_val_raw)
 
-        full_by_hidden = ("kuota penuh" in st_low) and hide_is_hidden
-        is_full_zero = (isinstance(sisa, int) and sisa == 0)
+    full_by_hidden = ("kuota penuh" in keywords) and hide_is_hidden
+    is_full_zero = (isinstance(sisa, int) and sisa == 0)
 
-        is_full = bool(is_full_text or full_by_hidden or is_full_zero)
+    is_full = bool(is_full_text or full_by_hidden or is_full_zero)
 
-        # available hanya jika tidak penuh DAN ada indikasi tersedia ATAU sisa>0
-        available = (not is_full) and (
-            any(k in st_low for k in ["tersedia", "available", "tersisa"]) or
-            (isinstance(sisa, int) and sisa > 0)
-        )
+    # available hanya jika tidak penuh DAN ada indikasi tersedia ATAU sisa>0
+    available = (not is_full) and (
+        not keywords.isdisjoint(_STATUS_AVAILABLE) or
+        (isinstance(sisa, int) and sisa > 0)
+    )
 
-        rows.append({
-            "tanggalText": tanggal_text,
-            "tanggalISO": tanggal_iso,
-            "statusText": status_text,
-            "sisa": sisa,
-            "isFull": is_full,
-            "available": available
-        })
-    return rows
-
-def _match_target(row: Dict[str, Any], target: Union[int, str]) -> bool:
-    """Cocokkan baris dengan target tanggal."""
+    return KapasitasRow(tanggal_text, tanggal_iso, status_text, sisa, is_full, available)
+
+def parse_kapasitas_rows(html: str) -> List[KapasitasRow]:
+    """
+    Parse tabel kapasitas menjadi list KapasitasRow:
+    (tanggalText, tanggalISO, statusText, sisa, isFull, available)
+    Coba regex dulu; jika skema HTML berubah, pakai selectolax/BeautifulSoup.
+    Untuk polling satu target, pakai parse_first_matching_row (lebih hemat).
+    """
+    try:
+        return [_build_row(tanggal_text, *_read_status_cell_regex(cell))
+                for tanggal_text, cell in _scan_cells_regex(html)]
+    except _SchemaDrift:
+        return [_build_row(tanggal_text, *_read_status_cell(td))
+                for tanggal_text, td in _iter_date_cells(html)]
+
+def _first_match(cells: Iterable[Tuple[str, Any]],
+                 read_status: Callable[[Any], _StatusCell],
+                 matcher: RowMatcher) -> Optional[KapasitasRow]:
+    for tanggal_text, cell in cells:
+        tanggal_iso = to_iso_from_tanggal_id(tanggal_text)
+        if matcher(tanggal_iso, tanggal_text):
+            return _build_row(tanggal_text, *read_status(cell), tanggal_iso=tanggal_iso)
+    return None
+
+def parse_first_matching_row(html: str,
+                             matcher: RowMatcher) -> Optional[KapasitasRow]:
+    """
+    Cari baris pertama yang cocok dengan `matcher` (lihat _make_matcher).
+    Tiap baris hanya dibaca tanggalnya; sel status diproses hanya untuk baris yang cocok.
+    """
+    try:
+        return _first_match(_scan_cells_regex(html), _read_status_cell_regex, matcher)
+    except _SchemaDrift:
+        return _first_match(_iter_date_cells(html), _read_status_cell, matcher)
+
+def _make_matcher(target: Union[int, str]) -> RowMatcher:
+    """
+    Resolusi target tanggal SEKALI (ISO / angka hari / format Indonesia / substring),
+    lalu kembalikan fungsi pencocok (tanggalISO, tanggalText) yang murah dipanggil per baris.
+    """
     if isinstance(target, int):
         dd = f"-{int(target):02d}"
-        return bool(row.get("tanggalISO") and row["tanggalISO"].endswith(dd))
+        return lambda tanggal_iso, tanggal_text: bool(tanggal_iso and tanggal_iso.endswith(dd))
     if isinstance(target, str):
         t = target.strip()
         # ISO
         if len(t) == 10 and t[4] == "-" and t[7] == "-":
-            return row.get("tanggalISO") == t
-        # Coba format Indonesia
-        iso = to_iso_from_tanggal_id(t)
+            iso: Optional[str] = t
+        else:
+            # Coba format Indonesia
+            iso = to_iso_from_tanggal_id(t)
         if iso:
-            return row.get("tanggalISO") == iso
+            return lambda tanggal_iso, tanggal_text: tanggal_iso == iso
         # fallback: substring pada tanggalText
-        return t.lower() in (row.get("tanggalText", "").lower())
-    return False
+        t_low = t.lower()
+        return lambda tanggal_iso, tanggal_text: t_low in (tanggal_text or "").lower()
+    return lambda tanggal_iso, tanggal_text: False
 
-def _human_summary(row: Dict[str, Any]) -> str:
+def _human_summary(row: KapasitasRow) -> str:
     """Ringkasan ramah-awam, multi-baris (berwarna)."""
-    sisa = row.get("sisa")
+    sisa = row.sisa
 
     # Jika sisa adalah int (termasuk minus), tampilkan angkanya.
     sisa_txt = f"{sisa} kuota" if isinstance(sisa, int) else "tidak diketahui"
 
-    available = bool(row.get("available"))
-    is_full = bool(row.get("isFull"))
+    available = row.available
+    is_full = row.isFull
 
     if available:
         avail_txt = C("TERSEDIA ✅", Fore.GREEN, bright=True)
@@ -249,9 +616,9 @@ def _human_summary(row: Dict[str, Any]) -> str:
     else:
         sisa_colored = C(sisa_txt, Fore.YELLOW)
 
-    tanggal_line = f"Tanggal : {C(row.get('tanggalText') or '-', Fore.CYAN, bright=True)} " \
-                   f"(ISO: {C(row.get('tanggalISO') or '-', Fore.MAGENTA)})"
-    status_line  = f"Status  : {C(row.get('statusText') or '-', Fore.WHITE)}"
+    tanggal_line = f"Tanggal : {C(row.tanggalText or '-', Fore.CYAN, bright=True)} " \
+                   f"(ISO: {C(row.tanggalISO or '-', Fore.MAGENTA)})"
+    status_line  = f"Status  : {C(row.statusText or '-', Fore.WHITE)}"
     sisa_line    = f"Sisa    : {sisa_colored}"
     info_line    = f"Info    : {avail_txt}"
 
@@ -259,43 +626,112 @@ def _human_summary(row: Dict[str, Any]) -> str:
 
 
 # ======================= HTTP REQUEST =======================
-def get_kapasitas(session: Optional[requests.Session] = None,
+def get_kapasitas(session: Optional[Any] = None,
                   id_site: int = 8,
                   year_month: str = "2025-10",
                   timeout_connect: int = 5,
                   timeout_read: int = 45) -> str:
     """
     Hit endpoint get_view (POST) dan kembalikan HTML string.
-    Akan menjaga cookie (ci_session) jika menggunakan Session yang sama.
+    Akan menjaga cookie (ci_session) & koneksi keep-alive jika menggunakan Session yang sama.
+    `session` boleh requests.Session (build_session) atau httpx.Client (build_http2_client).
     """
     s = session or build_session(force_ipv4=True)
     data = {"action": "kapasitas", "id_site": str(id_site), "year_month": year_month}
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "Accept": "text/html, */*; q=0.01",
-        "X-Requested-With": "XMLHttpRequest",
-        "Origin": BASE_URL,
-        "Referer": BASE_URL + "/"
-    }
+    cache_key = (id_site, year_month)
+    headers, cached_html = _get_view_headers(cache_key)
+
+    timeout = _timeout_for(s, timeout_connect, timeout_read)
 
     t0 = time.monotonic()
-    resp = s.post(GET_VIEW_URL, data=data, headers=headers, timeout=(timeout_connect, timeout_read))
+    resp = s.post(GET_VIEW_URL, data=data, headers=headers, timeout=timeout)
+    if resp.status_code in STALE_SESSION_STATUS:
+        # Cookie ci_session basi: ambil cookie baru lewat halaman utama, lalu ulang sekali
+        print(f"{ts(C('[Session]', Fore.MAGENTA))} HTTP {resp.status_code}, perbarui cookie session.")
+        s.get(BASE_URL, timeout=timeout)
+        resp = s.post(GET_VIEW_URL, data=data, headers=headers, timeout=timeout)
     t1 = time.monotonic()
-    resp.raise_for_status()
-    html = resp.text
+    if _is_not_modified(resp.status_code, cached_html):
+        html = cached_html
+    else:
+        resp.raise_for_status()
+        # Endpoint selalu UTF-8: decode langsung, lewati deteksi charset (chardet) di resp.text
+        html = resp.content.decode("utf-8", errors="replace")
+        _remember_get_view(cache_key, resp.headers, html)
     t2 = time.monotonic()
 
-    print(
-        f"{ts(C('[get_view]', Fore.CYAN))} "
-        f"{C(str(resp.status_code), Fore.GREEN if resp.ok else Fore.RED, bright=True)} "
-        f"{C(resp.reason or '', Fore.WHITE)} | {C(str(len(html))+' bytes', Fore.YELLOW)} | "
-        f"{C(f'total={t2-t0:.3f}s recv={t2-t1:.3f}s', Fore.CYAN)}"
-    )
+    if LOG_GET_VIEW:
+        _log_get_view(resp.status_code, len(html), t2 - t0, t2 - t1,
+                      wire=resp.headers.get("Content-Length"), encoding=resp.headers.get("Content-Encoding"))
     return html
 
+def _get_view_headers(cache_key: Tuple[int, str]) -> Tuple[Dict[str, str], Optional[str]]:
+    """
+    GET_VIEW_HEADERS + If-None-Match / If-Modified-Since jika respons sebelumnya tersimpan.
+    Juga kembalikan html tersimpan itu (snapshot), dipakai jika server menjawab "tidak berubah".
+    """
+    cached = _GET_VIEW_CACHE.get(cache_key)
+    if not cached:
+        return GET_VIEW_HEADERS, None
+    etag, last_modified, html = cached
+    headers = dict(GET_VIEW_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers, html
+
+def _is_not_modified(status_code: int, cached_html: Optional[str]) -> bool:
+    """304/412 atas request kondisional = html tersimpan masih berlaku (tanpa kondisional: error biasa)."""
+    return status_code in NOT_MODIFIED_STATUS and cached_html is not None
+
+def _remember_get_view(cache_key: Tuple[int, str], resp_headers: Any, html: str) -> None:
+    """Simpan html bila server memberi validator (ETag/Last-Modified); selain itu buang cache lama."""
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if etag or last_modified:
+        _GET_VIEW_CACHE[cache_key] = (etag, last_modified, html)
+    else:
+        _GET_VIEW_CACHE.pop(cache_key, None)
+
+def _log_get_view(status_code: int, size: int, total: float, recv: float,
+                  wire: Optional[str] = None, encoding: Optional[str] = None) -> None:
+    """
+    Satu baris log hasil POST get_view (dipanggil setelah raise_for_status, jadi selalu sukses).
+    `size` = ukuran HTML setelah dekompresi; `wire`/`encoding` dari header respons (jika ada).
+    """
+    wire_txt = f" (wire {wire} {encoding or 'identity'})" if wire else ""
+    print(f"{ts(_GET_VIEW_TAG)} {_PRE_OK}{status_code}{_RST} | "
+          f"{_PRE_SIZE}{size} bytes{wire_txt}{_RST} | "
+          f"{_PRE_TIME}total={total:.3f}s recv={recv:.3f}s{_RST}")
+
 
 # ======================= API UTAMA =======================
-def get_kapasitas_by_date(session: Optional[requests.Session] = None,
+def _find_and_report(html: str,
+                     target: Union[int, str],
+                     year_month: str,
+                     match: Optional[RowMatcher] = None,
+                     memo: Optional[Dict[str, Any]] = None) -> Optional[KapasitasRow]:
+    """
+    Parse HTML, cari baris target, cetak ringkasan; return row/None.
+    `match` (dari _make_matcher) bisa diberikan agar tidak dibangun ulang tiap polling.
+    `memo` (dict kosong milik loop) menyimpan html & hasil terakhir: html sama = tidak di-parse ulang.
+    """
+    if memo is not None and memo.get("html") == html:
+        found = memo["row"]
+    else:
+        found = parse_first_matching_row(html, match or _make_matcher(target))
+        if memo is not None:
+            memo["html"], memo["row"] = html, found
+    if not found:
+        print(f"{ts(C('[Info]', Fore.YELLOW))} Tanggal {C(str(target), Fore.CYAN)} "
+              f"tidak ditemukan di {C(year_month, Fore.MAGENTA)}.")
+        return None
+    print(f"{ts(C('[Ditemukan]', Fore.GREEN))} Target: {C(str(target), Fore.CYAN, bright=True)}")
+    print(_human_summary(found))
+    return found
+
+def get_kapasitas_by_date(session: Optional[Any] = None,
                           id_site: int = 8,
                           year_month: str = "2025-10",
                           target: Union[int, str] = None,
@@ -303,7 +739,7 @@ def get_kapasitas_by_date(session: Optional[requests.Session] = None,
                           timeout_read: int = 45,
                           loop_forever: bool = False,
                           interval_sec: int = 20,
-                          stop_when_available: bool = False) -> Optional[Dict[str, Any]]:
+                          stop_when_available: bool = False) -> Optional[KapasitasRow]:
     """
     Ambil satu baris untuk tanggal target.
     - Jika loop_forever=False (default): cek sekali, return row/None.
@@ -312,87 +748,119 @@ def get_kapasitas_by_date(session: Optional[requests.Session] = None,
         * Jika stop_when_available=False, loop tidak pernah berhenti (kecuali Ctrl+C).
     """
     s = session or build_session(force_ipv4=True)
+    match = _make_matcher(target)
+    memo: Dict[str, Any] = {}
 
-    def _once() -> Optional[Dict[str, Any]]:
+    def _once() -> Optional[KapasitasRow]:
         html = get_kapasitas(session=s, id_site=id_site, year_month=year_month,
                              timeout_connect=timeout_connect, timeout_read=timeout_read)
-        rows = parse_kapasitas_rows(html)
-        found = next((r for r in rows if _match_target(r, target)), None)
-        if not found:
-            print(f"{ts(C('[Info]', Fore.YELLOW))} Tanggal {C(str(target), Fore.CYAN)} "
-                  f"tidak ditemukan di {C(year_month, Fore.MAGENTA)}.")
-            return None
-        print(f"{ts(C('[Ditemukan]', Fore.GREEN))} Target: {C(str(target), Fore.CYAN, bright=True)}")
-        print(_human_summary(found))
-        return found
+        return _find_and_report(html, target, year_month, match, memo)
 
     if not loop_forever:
         return _once()
 
     # Loop tanpa henti (kecuali Ctrl+C). Opsional berhenti jika sudah tersedia.
+    # Session (TLS + cookie ci_session) dipakai ulang; hanya dibangun ulang saat error beruntun.
+    # Parse + laporan jalan di worker thread: jika parse belum selesai saat deadline,
+    # request berikutnya langsung dikirim dan hasil parse diambil begitu siap.
     err_count = 0
-    requests_made = 0
+    pending: Optional[Future] = None
+
+    def _collect(timeout: Optional[float]) -> Optional[KapasitasRow]:
+        """Ambil hasil parse tertunda (tunggu maks `timeout`); return baris jika loop harus berhenti."""
+        nonlocal pending
+        if pending is None:
+            return None
+        done, _ = wait_futures([pending], timeout=timeout)
+        if not done:
+            return None
+        fut, pending = pending, None
+        try:
+            row = fut.result()
+        except Exception as e:
+            # Gagal parse tidak terkait jaringan: laporkan saja, tanpa backoff
+            print(f"{ts(C('[Peringatan]', Fore.RED))} Parse error: {C(repr(e), Fore.RED)}")
+            return None
+        if row and stop_when_available and row.available:
+            print(f"{ts(C('[Selesai]', Fore.GREEN))} {C('TERSEDIA', Fore.GREEN, bright=True)} — menghentikan loop.")
+            return row
+        return None
+
     try:
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                row = _once()
-                requests_made += 1
-                err_count = 0
-
-                # Refresh session tiap 100 permintaan
-                if requests_made % 100 == 0:
-                    try:
-                        s.close()
-                    finally:
-                        s = build_session(force_ipv4=True)  # rebuild
-                        print(f"{ts(C('[Session]', Fore.MAGENTA))} Refresh session (100 requests).")
-
-                if row and stop_when_available and row.get("available"):
-                    print(f"{ts(C('[Selesai]', Fore.GREEN))} {C('TERSEDIA', Fore.GREEN, bright=True)} — menghentikan loop.")
-                    return row
-
-                # jeda normal
-                time.sleep(interval_sec)
-
-            except KeyboardInterrupt:
-                raise
-            except Exception as e:
-                err_count += 1
-                extra = min(60, 2 ** err_count)  # backoff maksimal +60s
-                wait = interval_sec + extra
-                print(f"{ts(C('[Peringatan]', Fore.RED))} Percobaan #{C(str(attempt), Fore.YELLOW)} "
-                      f"error: {C(repr(e), Fore.RED)}")
-                print(f"{ts(C('[Backoff]', Fore.YELLOW))} tidur {C(str(wait)+'s', Fore.YELLOW)} "
-                      f"(error#{C(str(err_count), Fore.YELLOW)}).")
-                time.sleep(wait)
-                # opsional: refresh session setelah error berturut-turut
-                if err_count >= 3:
-                    try:
-                        s.close()
-                    finally:
-                        s = build_session(force_ipv4=True)
-                        print(f"{ts(C('[Session]', Fore.MAGENTA))} Refresh session (error streak).")
+        with ThreadPoolExecutor(max_workers=1) as parser_pool:
+            attempt = 0
+            while True:
+                attempt += 1
+                # Jadwal berbasis deadline: interval dihitung dari AWAL request (tanpa drift)
+                next_wake = time.monotonic() + interval_sec
+                try:
+                    # Parse sebelumnya sudah selesai saat tidur? cek dulu sebelum request baru
+                    row = _collect(timeout=0)
+                    if row:
+                        return row
+
+                    html = get_kapasitas(session=s, id_site=id_site, year_month=year_month,
+                                         timeout_connect=timeout_connect, timeout_read=timeout_read)
+                    err_count = 0
+
+                    # Parse sebelumnya masih jalan (sudah overlap dengan request barusan): tunggu hasilnya
+                    row = _collect(timeout=None)
+                    if row:
+                        return row
+
+                    pending = parser_pool.submit(_find_and_report, html, target, year_month, match, memo)
+
+                    # Tunggu parse paling lama sampai deadline; selesai lebih cepat = cek langsung
+                    row = _collect(timeout=max(0.0, next_wake - time.monotonic()))
+                    if row:
+                        return row
+
+                    # jeda normal (sisa waktu sampai deadline)
+                    _sleep_until(next_wake)
+
+                except KeyboardInterrupt:
+                    raise
+                except Exception as e:
+                    err_count += 1
+                    extra = min(60, 2 ** err_count)  # backoff maksimal +60s
+                    # Backoff dihitung dari saat gagal (bukan deadline), agar tetap ada jeda setelah timeout
+                    wait = interval_sec + extra
+                    print(f"{ts(C('[Peringatan]', Fore.RED))} Percobaan #{C(str(attempt), Fore.YELLOW)} "
+                          f"error: {C(repr(e), Fore.RED)}")
+                    # Parse tertunda bisa saja sudah menemukan TERSEDIA: ambil sebelum backoff
+                    row = _collect(timeout=None)
+                    if row:
+                        return row
+                    print(f"{ts(C('[Backoff]', Fore.YELLOW))} tidur {C(str(wait)+'s', Fore.YELLOW)} "
+                          f"(error#{C(str(err_count), Fore.YELLOW)}).")
+                    time.sleep(wait)
+                    # opsional: refresh session setelah error berturut-turut
+                    if err_count >= 3:
+                        try:
+                            s.close()
+                        finally:
+                            s = _build_like(s)
+                            print(f"{ts(C('[Session]', Fore.MAGENTA))} Refresh session (error streak).")
 
     except KeyboardInterrupt:
         print(f"\n{ts(C('[Stop]', Fore.MAGENTA))} Dihentikan oleh pengguna (Ctrl+C).")
         return None
 
 
-def wait_until_tanggal_ada(session: Optional[requests.Session] = None,
+def wait_until_tanggal_ada(session: Optional[Any] = None,
                            id_site: int = 8,
                            year_month: str = "2025-10",
                            target: Union[int, str] = None,
                            interval_sec: int = 20,
                            max_attempts: int = 9999,
                            timeout_connect: int = 5,
-                           timeout_read: int = 45) -> Optional[Dict[str, Any]]:
+                           timeout_read: int = 45) -> Optional[KapasitasRow]:
     """Loop sampai tanggal target MUNCUL di kalender (apa pun statusnya), atau habis attempt."""
     s = session or build_session(force_ipv4=True)
     for attempt in range(1, max_attempts + 1):
+        next_wake = time.monotonic() + interval_sec
         try:
-            row = get_kapasitas_by_date(s, id_site=id_site, year_month=year_month, target=target,
+            row = get_kapasitas_by_date(session=s, id_site=id_site, year_month=year_month, target=target,
                                         timeout_connect=timeout_connect, timeout_read=timeout_read)
             if row:
                 print(f"{ts(C('[Ditemukan]', Fore.GREEN))} {C('✅ DITEMUKAN', Fore.GREEN, bright=True)} "
@@ -402,31 +870,33 @@ def wait_until_tanggal_ada(session: Optional[requests.Session] = None,
         except Exception as e:
             print(f"{ts(C('[Peringatan]', Fore.RED))} Percobaan #{C(str(attempt), Fore.YELLOW)} error: {C(repr(e), Fore.RED)}")
 
+        remaining = max(0.0, next_wake - time.monotonic())  # sisa jeda sampai deadline, bukan interval penuh
         print(f"{ts(C('[Menunggu]', Fore.WHITE, dim=True))} Belum ada di kalender. "
-              f"Coba lagi dalam {C(str(interval_sec)+' detik', Fore.YELLOW)} "
+              f"Coba lagi dalam {C(f'{remaining:.1f} detik', Fore.YELLOW)} "
               f"(percobaan #{C(str(attempt), Fore.YELLOW)}).")
-        time.sleep(interval_sec)
+        _sleep_until(next_wake)
 
     print(f"{ts(C('[Gagal]', Fore.RED))} Batas percobaan habis, tanggal {C(str(target), Fore.CYAN)} "
           f"belum muncul di {C(year_month, Fore.MAGENTA)}.")
     return None
 
 
-def wait_until_tanggal_tersedia(session: Optional[requests.Session] = None,
+def wait_until_tanggal_tersedia(session: Optional[Any] = None,
                                 id_site: int = 8,
                                 year_month: str = "2025-10",
                                 target: Union[int, str] = None,
                                 interval_sec: int = 20,
                                 max_attempts: int = 9999,
                                 timeout_connect: int = 5,
-                                timeout_read: int = 45) -> Optional[Dict[str, Any]]:
+                                timeout_read: int = 45) -> Optional[KapasitasRow]:
     """Loop sampai tanggal target MUNCUL dan BERSTATUS TERSEDIA (available==True), atau habis attempt."""
     s = session or build_session(force_ipv4=True)
     for attempt in range(1, max_attempts + 1):
+        next_wake = time.monotonic() + interval_sec
         try:
-            row = get_kapasitas_by_date(s, id_site=id_site, year_month=year_month, target=target,
+            row = get_kapasitas_by_date(session=s, id_site=id_site, year_month=year_month, target=target,
                                         timeout_connect=timeout_connect, timeout_read=timeout_read)
-            if row and row.get("available"):
+            if row and row.available:
                 print(f"{ts(C('[Sukses]', Fore.GREEN))} {C('🎉 TERSEDIA!', Fore.GREEN, bright=True)} "
                       f"(percobaan #{C(str(attempt), Fore.YELLOW)})")
                 print(_human_summary(row))
@@ -434,16 +904,254 @@ def wait_until_tanggal_tersedia(session: Optional[requests.Session] = None,
         except Exception as e:
             print(f"{ts(C('[Peringatan]', Fore.RED))} Percobaan #{C(str(attempt), Fore.YELLOW)} error: {C(repr(e), Fore.RED)}")
 
+        remaining = max(0.0, next_wake - time.monotonic())  # sisa jeda sampai deadline, bukan interval penuh
         print(f"{ts(C('[Menunggu]', Fore.WHITE, dim=True))} Belum tersedia. "
-              f"Akan cek lagi dalam {C(str(interval_sec)+' detik', Fore.YELLOW)} "
+              f"Akan cek lagi dalam {C(f'{remaining:.1f} detik', Fore.YELLOW)} "
               f"(percobaan #{C(str(attempt), Fore.YELLOW)}).")
-        time.sleep(interval_sec)
+        _sleep_until(next_wake)
 
     print(f"{ts(C('[Gagal]', Fore.RED))} Batas percobaan habis, "
           f"{C(str(target), Fore.CYAN)} belum tersedia di {C(year_month, Fore.MAGENTA)}.")
     return None
 
 
+# ======================= ASYNC (MULTI TARGET) =======================
+async def get_kapasitas_async(session: Any,
+                              id_site: int = 8,
+                              year_month: str = "2025-10",
+                              timeout_connect: int = 5,
+                              timeout_read: int = 45) -> str:
+    """
+    Versi async get_kapasitas: POST get_view, kembalikan HTML string.
+    `session` = aiohttp.ClientSession atau httpx.AsyncClient (lihat build_async_session).
+    """
+    data = {"action": "kapasitas", "id_site": str(id_site), "year_month": year_month}
+    cache_key = (id_site, year_month)
+    headers, cached_html = _get_view_headers(cache_key)
+    post_args = (session, data, headers, cached_html, timeout_connect, timeout_read)
+
+    t0 = time.monotonic()
+    resp, status, html, t1 = await _post_get_view_async(*post_args, allow_stale=True)
+    if status in STALE_SESSION_STATUS:
+        # Cookie ci_session basi: ambil cookie baru lewat halaman utama, lalu ulang sekali
+        print(f"{ts(C('[Session]', Fore.MAGENTA))} HTTP {status}, perbarui cookie session.")
+        await _refresh_cookie_async(session, timeout_connect, timeout_read)
+        resp, status, html, t1 = await _post_get_view_async(*post_args)
+    if html is None:
+        html = cached_html
+    else:
+        _remember_get_view(cache_key, resp.headers, html)
+    t2 = time.monotonic()
+
+    if LOG_GET_VIEW:
+        _log_get_view(status, len(html), t2 - t0, t2 - t1,
+                      wire=resp.headers.get("Content-Length"), encoding=resp.headers.get("Content-Encoding"))
+    return html
+
+
+async def _post_get_view_async(session: Any,
+                               data: Dict[str, str],
+                               headers: Dict[str, str],
+                               cached_html: Optional[str],
+                               timeout_connect: int,
+                               timeout_read: int,
+                               allow_stale: bool = False) -> Tuple[Any, int, Optional[str], float]:
+    """
+    Satu POST get_view async: (resp, status, html, waktu header diterima).
+    html None = server menjawab "tidak berubah", atau cookie basi jika allow_stale=True.
+    """
+    if _is_httpx_client(session):
+        resp = await session.post(GET_VIEW_URL, data=data, headers=headers,
+                                  timeout=_timeout_for(session, timeout_connect, timeout_read))
+        t1 = time.monotonic()
+        status = resp.status_code
+        if _is_not_modified(status, cached_html) or (allow_stale and status in STALE_SESSION_STATUS):
+            return resp, status, None, t1  # httpx menganggap 304 sebagai error di raise_for_status
+        resp.raise_for_status()
+        return resp, status, resp.content.decode("utf-8", errors="replace"), t1
+
+    timeout = aiohttp.ClientTimeout(sock_connect=timeout_connect, sock_read=timeout_read)
+    async with session.post(GET_VIEW_URL, data=data, headers=headers, timeout=timeout) as resp:
+        t1 = time.monotonic()
+        status = resp.status
+        if _is_not_modified(status, cached_html) or (allow_stale and status in STALE_SESSION_STATUS):
+            return resp, status, None, t1
+        resp.raise_for_status()
+        return resp, status, await resp.text(encoding="utf-8", errors="replace"), t1
+
+async def _refresh_cookie_async(session: Any, timeout_connect: int, timeout_read: int) -> None:
+    """GET halaman utama agar server memberi cookie ci_session baru (versi async)."""
+    if _is_httpx_client(session):
+        await session.get(BASE_URL, timeout=_timeout_for(session, timeout_connect, timeout_read))
+        return
+    timeout = aiohttp.ClientTimeout(sock_connect=timeout_connect, sock_read=timeout_read)
+    async with session.get(BASE_URL, timeout=timeout) as resp:
+        await resp.read()
+
+
+class _SharedAsyncSession:
+    """Session async bersama banyak target, bisa dibangun ulang saat error beruntun."""
+
+    def __init__(self, force_ipv4: bool = True, http2: bool = False) -> None:
+        self._force_ipv4 = force_ipv4
+        self._http2 = http2
+        self.session = build_async_session(force_ipv4=force_ipv4, http2=http2)
+
+    async def rebuild(self, stale: Any) -> None:
+        """Ganti session `stale` dengan yang baru (sekali saja walau banyak target error bersamaan)."""
+        if self.session is not stale:
+            return  # sudah dibangun ulang oleh target lain
+        self.session = build_async_session(force_ipv4=self._force_ipv4, http2=self._http2)
+        print(f"{ts(C('[Session]', Fore.MAGENTA))} Refresh session async (error streak).")
+        await _close_async_session(stale)
+
+    async def aclose(self) -> None:
+        await _close_async_session(self.session)
+
+
+async def _close_async_session(session: Any) -> None:
+    """Tutup aiohttp.ClientSession / httpx.AsyncClient."""
+    if _is_httpx_client(session):
+        await session.aclose()
+    else:
+        await session.close()
+
+
+def _clear_cookies(session: Any) -> None:
+    """Buang cookie (ci_session) pada session async aiohttp / httpx."""
+    if _is_httpx_client(session):
+        session.cookies.clear()
+    else:
+        session.cookie_jar.clear()
+
+
+async def poll_target(session: Any,
+                      id_site: int = 8,
+                      year_month: str = "2025-10",
+                      target: Union[int, str] = None,
+                      interval_sec: int = 20,
+                      stop_when_available: bool = False,
+                      timeout_connect: int = 5,
+                      timeout_read: int = 45,
+                      shared: Optional[_SharedAsyncSession] = None) -> Optional[KapasitasRow]:
+    """
+    Polling satu target di atas session async bersama.
+    Berhenti (return row) jika stop_when_available=True dan target TERSEDIA;
+    selain itu jalan terus sampai task dibatalkan.
+    shared: jika ada, session diambil dari sini tiap percobaan dan dibangun ulang saat error beruntun;
+    tanpa shared, error beruntun hanya membuang cookie `session`.
+    """
+    match = _make_matcher(target)
+    memo: Dict[str, Any] = {}
+    err_count = 0
+    attempt = 0
+    while True:
+        attempt += 1
+        next_wake = time.monotonic() + interval_sec
+        ses = shared.session if shared is not None else session
+        try:
+            html = await get_kapasitas_async(ses, id_site=id_site, year_month=year_month,
+                                             timeout_connect=timeout_connect, timeout_read=timeout_read)
+            row = _find_and_report(html, target, year_month, match, memo)
+            err_count = 0
+
+            if row and stop_when_available and row.available:
+                print(f"{ts(C('[Selesai]', Fore.GREEN))} {C(str(target), Fore.CYAN, bright=True)} "
+                      f"{C('TERSEDIA', Fore.GREEN, bright=True)} — berhenti polling target ini.")
+                return row
+
+            await asyncio.sleep(max(0.0, next_wake - time.monotonic()))
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            err_count += 1
+            extra = min(60, 2 ** err_count)  # backoff maksimal +60s
+            # Backoff dihitung dari saat gagal (bukan deadline), agar tetap ada jeda setelah timeout
+            wait = interval_sec + extra
+            print(f"{ts(C('[Peringatan]', Fore.RED))} {C(str(target), Fore.CYAN)} "
+                  f"percobaan #{C(str(attempt), Fore.YELLOW)} error: {C(repr(e), Fore.RED)}")
+            print(f"{ts(C('[Backoff]', Fore.YELLOW))} tidur {C(str(wait)+'s', Fore.YELLOW)} "
+                  f"(error#{C(str(err_count), Fore.YELLOW)}).")
+            await asyncio.sleep(wait)
+            # refresh session setelah error berturut-turut (cookie/pool bisa sudah rusak)
+            if err_count >= 3:
+                if shared is not None:
+                    await shared.rebuild(ses)
+                else:
+                    _clear_cookies(ses)
+                    print(f"{ts(C('[Session]', Fore.MAGENTA))} Cookie session dibuang (error streak).")
+
+
+async def check_target_once(session: Any,
+                            id_site: int = 8,
+                            year_month: str = "2025-10",
+                            target: Union[int, str] = None,
+                            timeout_connect: int = 5,
+                            timeout_read: int = 45) -> Optional[KapasitasRow]:
+    """Sekali cek satu target di atas session async bersama (tanpa loop)."""
+    try:
+        html = await get_kapasitas_async(session, id_site=id_site, year_month=year_month,
+                                         timeout_connect=timeout_connect, timeout_read=timeout_read)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        # Satu target gagal tidak membatalkan target lain di gather
+        print(f"{ts(C('[Peringatan]', Fore.RED))} {C(str(target), Fore.CYAN)} error: {C(repr(e), Fore.RED)}")
+        return None
+    return _find_and_report(html, target, year_month)
+
+
+async def watch_targets_async(targets: List[Union[int, str]],
+                              id_site: int = 8,
+                              year_month: Optional[str] = None,
+                              interval_sec: int = 20,
+                              stop_when_available: bool = False,
+                              timeout_connect: int = 5,
+                              timeout_read: int = 45,
+                              force_ipv4: bool = True,
+                              http2: bool = False,
+                              loop_forever: bool = True) -> List[Optional[KapasitasRow]]:
+    """
+    Polling banyak target bersamaan dalam satu event loop & satu connection pool.
+    year_month tiap target diturunkan dari targetnya; `year_month` dipakai untuk target angka hari.
+    http2=True: semua target di-multiplex lewat satu koneksi HTTP/2 (httpx).
+    loop_forever=False: cukup satu kali cek per target (bersamaan), lalu selesai.
+    """
+    jobs = []
+    for t in targets:
+        ym = _derive_year_month_from_target(t) or year_month
+        if ym is None:
+            raise ValueError(f"year_month wajib untuk target angka hari: {t!r}")
+        jobs.append((ym, t))
+
+    shared = _SharedAsyncSession(force_ipv4=force_ipv4, http2=http2)
+    try:
+        if not loop_forever:
+            return await asyncio.gather(*[
+                check_target_once(shared.session, id_site=id_site, year_month=ym, target=t,
+                                  timeout_connect=timeout_connect, timeout_read=timeout_read)
+                for ym, t in jobs
+            ])
+        return await asyncio.gather(*[
+            poll_target(shared.session, id_site=id_site, year_month=ym, target=t,
+                        interval_sec=interval_sec, stop_when_available=stop_when_available,
+                        timeout_connect=timeout_connect, timeout_read=timeout_read, shared=shared)
+            for ym, t in jobs
+        ])
+    finally:
+        await shared.aclose()
+
+
+def watch_targets(targets: List[Union[int, str]], **kwargs: Any) -> Optional[List[Optional[KapasitasRow]]]:
+    """Pembungkus sync untuk watch_targets_async (berhenti dengan Ctrl+C)."""
+    try:
+        return asyncio.run(watch_targets_async(targets, **kwargs))
+    except KeyboardInterrupt:
+        print(f"\n{ts(C('[Stop]', Fore.MAGENTA))} Dihentikan oleh pengguna (Ctrl+C).")
+        return None
+
+
 # ======================= ENTRY POINT (CLI) =======================
 def _derive_year_month_from_target(target: Union[int, str]) -> Optional[str]:
     """
@@ -462,6 +1170,11 @@ def _derive_year_month_from_target(target: Union[int, str]) -> Optional[str]:
         return iso[:7]
     return None
 
+def _normalize_target(raw: str) -> Union[int, str]:
+    """Target dari CLI: int jika digit semua (angka hari), selain itu string apa adanya."""
+    raw = str(raw).strip()
+    return int(raw) if raw.isdigit() else raw
+
 if __name__ == "__main__":
     import argparse
 
@@ -472,31 +1185,59 @@ if __name__ == "__main__":
     parser.add_argument("--site-id", type=int, default=8, help="ID site (default 8 = Semeru)")
     parser.add_argument("--year-month", type=str, default=None, help="Bulan target format YYYY-MM")
     parser.add_argument("--target", required=False, help="Tanggal target: 2025-10-18 / '18 Oktober 2025' / 18")
+    parser.add_argument("--targets", required=False,
+                        help="Beberapa target dipisah koma, dicek bersamaan (async, butuh aiohttp; tambah --loop untuk polling): "
+                             "'2025-10-18,2025-11-02'")
     parser.add_argument("--loop", action="store_true", help="Loop terus sampai dihentikan")
     parser.add_argument("--stop-when-available", action="store_true", help="Berhenti otomatis jika TERSEDIA")
     parser.add_argument("--interval", type=int, default=20, help="Interval polling (detik)")
     parser.add_argument("--timeout-connect", type=int, default=5, help="Timeout CONNECT (detik)")
     parser.add_argument("--timeout-read", type=int, default=45, help="Timeout READ (detik)")
     parser.add_argument("--ipv4", action="store_true", help="Paksa IPv4 (disarankan di VPS/DC)")
+    parser.add_argument("--http2", action="store_true", help="Pakai HTTP/2 via httpx (pip install \"httpx[http2]\")")
+    parser.add_argument("--quiet", action="store_true", help="Jangan cetak log tiap request get_view")
 
     args = parser.parse_args()
+    LOG_GET_VIEW = not args.quiet
+
+    # Mode multi target: satu proses, satu event loop, satu connection pool
+    if args.targets:
+        targets = [_normalize_target(t) for t in args.targets.split(",") if t.strip()]
+        if not args.year_month and any(_derive_year_month_from_target(t) is None for t in targets):
+            raise SystemExit("ERROR: --year-month wajib diisi jika ada target yang hanya angka hari")
+        if args.http2 and httpx is None:
+            raise SystemExit('ERROR: --http2 butuh httpx: pip install "httpx[http2]"')
+        if not args.http2 and aiohttp is None:
+            raise SystemExit("ERROR: --targets butuh aiohttp: pip install aiohttp (atau pakai --http2)")
+        watch_targets(
+            targets,
+            id_site=args.site_id,
+            year_month=args.year_month,
+            interval_sec=args.interval,
+            stop_when_available=args.stop_when_available,
+            timeout_connect=args.timeout_connect,
+            timeout_read=args.timeout_read,
+            force_ipv4=True,  # default paksa IPv4 di VPS
+            http2=args.http2,
+            loop_forever=args.loop,
+        )
+        raise SystemExit(0)
 
     # Target interaktif jika tidak diberikan
     if args.target is None:
         args.target = input("Masukkan target tanggal (contoh: 2025-10-18 / '18 Oktober 2025' / 18): ").strip()
 
     # Normalisasi target (int jika digit semua)
-    target_val: Union[int, str]
-    if str(args.target).isdigit():
-        target_val = int(args.target)
-    else:
-        target_val = args.target
+    target_val = _normalize_target(args.target)
 
     ym = args.year_month or _derive_year_month_from_target(target_val)
     if ym is None:
         raise SystemExit("ERROR: --year-month wajib diisi jika --target hanya angka hari (contoh: --year-month 2025-10)")
 
-    sess = build_session(force_ipv4=args.ipv4 or True)  # default paksa IPv4 di VPS
+    # default paksa IPv4 di VPS
+    # Pre-warm koneksi hanya berguna untuk loop; sekali cek cukup langsung POST
+    sess = (build_http2_client(force_ipv4=True) if args.http2
+            else build_session(force_ipv4=args.ipv4 or True, prewarm=args.loop))
 
     # Jalankan
     get_kapasitas_by_date(
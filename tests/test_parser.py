@@ -0,0 +1,58 @@
+"""Jalur regex (cepat) harus membaca baris yang sama dengan parser HTML (selectolax/BS4)."""
+import importlib.util
+import pathlib
+import unittest
+
+_SCRIPT = pathlib.Path(__file__).resolve().parent.parent / "semeru-kapasitas.py"
+_spec = importlib.util.spec_from_file_location("semeru_kapasitas", _SCRIPT)
+sk = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sk)
+
+SAMPLE_HTML = """
+<table class="table">
+  <thead><tr><th>Tanggal</th><th>Kuota</th></tr></thead>
+  <tbody>
+    <tr><td>4 Oktober 2025</td><td><span class="text-green">Tersedia</span><span class="hide">4</span></td></tr>
+    <!-- <tr><td>9 Oktober 2025</td><td><span class="text-green">Tersedia</span><span class="hide">9</span></td></tr> -->
+    <tr><td>5 Oktober 2025</td><td><span class="text-red">Penuh</span><span class="hide">0</span></td></tr>
+    <script>var tpl = '<tr><td>10 Oktober 2025</td><td><span class="text-green">Tersedia</span></td></tr>';</script>
+    <tr><td>6 Oktober 2025</td><td><span class="text-blue">Sisa &amp; terbatas</span><span class="hide">-2</span></td></tr>
+  </tbody>
+</table>
+"""
+
+
+def _cells_html_parser(html):
+    return [(text, sk._read_status_cell(td)) for text, td in sk._iter_date_cells(html)]
+
+
+def _cells_regex(html):
+    return [(text, sk._read_status_cell_regex(cell)) for text, cell in sk._scan_cells_regex(html)]
+
+
+class RegexParserTest(unittest.TestCase):
+    def test_regex_matches_html_parser(self):
+        self.assertEqual(_cells_regex(SAMPLE_HTML), _cells_html_parser(SAMPLE_HTML))
+
+    def test_comment_and_script_rows_ignored(self):
+        dates = [row.tanggalISO for row in sk.parse_kapasitas_rows(SAMPLE_HTML)]
+        self.assertEqual(dates, ["2025-10-04", "2025-10-05", "2025-10-06"])
+        self.assertIsNone(sk.parse_first_matching_row(SAMPLE_HTML, sk._make_matcher(9)))
+
+    def test_tbody_fragment_without_table(self):
+        # get_view bisa mengirim potongan <tbody> saja; parser HTML5 (Lexbor) tidak boleh membuangnya
+        fragment = SAMPLE_HTML[SAMPLE_HTML.index("<tbody>"):SAMPLE_HTML.index("</table>")]
+        self.assertEqual(_cells_html_parser(fragment), _cells_regex(SAMPLE_HTML))
+        self.assertEqual(_cells_regex(fragment), _cells_regex(SAMPLE_HTML))
+
+    def test_unterminated_comment_falls_back(self):
+        # Komentar tanpa "-->" menelan sisa dokumen (termasuk </tbody>): regex menyerah, parser HTML dipakai
+        html = SAMPLE_HTML.replace("-->", "")
+        with self.assertRaises(sk._SchemaDrift):
+            sk._scan_cells_regex(html)
+        dates = [row.tanggalISO for row in sk.parse_kapasitas_rows(html)]
+        self.assertEqual(dates, ["2025-10-04"])
+
+
+if __name__ == "__main__":
+    unittest.main()